@@ -9,20 +9,24 @@ injected for observability.
 from __future__ import annotations
 
 import asyncio
+import json
 import os
 import re
+import time
+from collections import deque
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime
 from io import BytesIO
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
 from uuid import uuid4
 
 import anyio
 import numpy as np
 from fastapi import Depends, FastAPI, Header, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel, Field, conint, confloat
 from scipy.io.wavfile import write as write_wav
 
@@ -194,10 +198,29 @@ _CAPABILITIES = CapabilityResponse(
         "Roadmap: multi-stem audio (voices, SFX, music, ensemble) with long-form timelines up to 120 minutes.",
     ],
 )
+_CAPABILITIES_BODY = json.dumps(jsonable_encoder(_CAPABILITIES)).encode("utf-8")
 
+_HEALTH_TTL_S = 1.0
+_health_cache: Tuple[float, bytes] = (float("-inf"), b"")
 
-_RATE_LIMIT_STATE: Dict[str, List[datetime]] = {}
-_RATE_LIMIT_LOCK = asyncio.Lock()
+
+def _health_body() -> bytes:
+    """Return the serialized heartbeat, refreshing the timestamp at most once per TTL."""
+
+    global _health_cache
+    now = time.monotonic()
+    expires_at, body = _health_cache
+    if now >= expires_at:
+        payload = {"status": "ok", "time": datetime.utcnow().isoformat() + "Z", "version": app.version}
+        body = json.dumps(payload).encode("utf-8")
+        _health_cache = (now + _HEALTH_TTL_S, body)
+    return body
+
+
+_RATE_LIMIT_WINDOW_S = 60.0
+_RATE_LIMIT_SWEEP_INTERVAL_S = 60.0
+_RATE_LIMIT_STATE: Dict[str, Deque[float]] = {}
+_RATE_LIMIT_LOCKS: Dict[str, asyncio.Lock] = {}
 
 
 @dataclass
@@ -227,28 +250,55 @@ async def _auth_dependency(config: ServiceConfig = Depends(get_service_config),
 
 async def _rate_limit_dependency(request: Request, config: ServiceConfig = Depends(get_service_config)) -> None:
     client_id = request.client.host if request.client else "unknown"
-    now = datetime.utcnow()
-    window_start = now - timedelta(minutes=1)
-    async with _RATE_LIMIT_LOCK:
-        history = _RATE_LIMIT_STATE.setdefault(client_id, [])
-        _RATE_LIMIT_STATE[client_id] = [ts for ts in history if ts > window_start]
-        if len(_RATE_LIMIT_STATE[client_id]) >= config.rate_limit_per_minute:
+    now = time.monotonic()
+    window_start = now - _RATE_LIMIT_WINDOW_S
+    lock = _RATE_LIMIT_LOCKS.get(client_id)
+    if lock is None:
+        lock = _RATE_LIMIT_LOCKS.setdefault(client_id, asyncio.Lock())
+    async with lock:
+        history = _RATE_LIMIT_STATE.get(client_id)
+        if history is None:
+            history = _RATE_LIMIT_STATE.setdefault(client_id, deque())
+        while history and history[0] <= window_start:
+            history.popleft()
+        if len(history) >= config.rate_limit_per_minute:
             raise RateLimitError()
-        _RATE_LIMIT_STATE[client_id].append(now)
+        history.append(now)
+
+
+def _evict_idle_clients(now: float) -> None:
+    """Drop rate-limit state for clients with no requests inside the window."""
+
+    window_start = now - _RATE_LIMIT_WINDOW_S
+    for client_id, history in list(_RATE_LIMIT_STATE.items()):
+        lock = _RATE_LIMIT_LOCKS.get(client_id)
+        if lock is not None and lock.locked():
+            continue
+        if not history or history[-1] <= window_start:
+            del _RATE_LIMIT_STATE[client_id]
+            _RATE_LIMIT_LOCKS.pop(client_id, None)
+
+
+async def _rate_limit_sweeper() -> None:
+    while True:
+        await asyncio.sleep(_RATE_LIMIT_SWEEP_INTERVAL_S)
+        _evict_idle_clients(time.monotonic())
 
 
+# ``response_model`` is kept for the OpenAPI schema only; returning a raw
+# ``Response`` bypasses FastAPI's validation and re-encoding.
 @app.get("/api/health", response_model=HealthResponse)
-async def health() -> HealthResponse:
+async def health() -> Response:
     """Simple heartbeat for frontends to verify connectivity."""
 
-    return HealthResponse(status="ok", time=datetime.utcnow().isoformat() + "Z", version=app.version)
+    return Response(content=_health_body(), media_type="application/json")
 
 
 @app.get("/api/capabilities", response_model=CapabilityResponse)
-async def capabilities() -> CapabilityResponse:
+async def capabilities() -> Response:
     """Return static capabilities describing enabled modalities and presets."""
 
-    return _CAPABILITIES
+    return Response(content=_CAPABILITIES_BODY, media_type="application/json")
 
 
 def _sanitize_filename(name: str) -> str:
@@ -369,12 +419,14 @@ async def lifespan(app: FastAPI):
     workers = max(1, config.concurrency_limit)
     semaphore = asyncio.Semaphore(workers)
     _worker_tasks.extend(asyncio.create_task(_worker(config, semaphore)) for _ in range(workers))
+    sweeper = asyncio.create_task(_rate_limit_sweeper())
     try:
         yield
     finally:
+        sweeper.cancel()
         for task in _worker_tasks:
             task.cancel()
-        await asyncio.gather(*_worker_tasks, return_exceptions=True)
+        await asyncio.gather(sweeper, *_worker_tasks, return_exceptions=True)
 
 
 app.router.lifespan_context = lifespan
@@ -48,7 +48,7 @@ def _fake_multimedia() -> Callable[..., DummyMultimediaResult]:
     return _inner
 
 
-def create_test_client(tmp_path: Path, models_ready: bool = True):
+def create_test_client(tmp_path: Path, models_ready: bool = True, **overrides: object):
     audio_calls: List[str] = []
     audio_fn = _fake_audio(audio_calls)
     multimedia_fn = _fake_multimedia()
@@ -60,6 +60,7 @@ def create_test_client(tmp_path: Path, models_ready: bool = True):
         output_root=tmp_path,
         max_queue_size=4,
         concurrency_limit=2,
+        **overrides,
     )
 
     original_get_config = server.get_service_config
@@ -74,6 +75,8 @@ def create_test_client(tmp_path: Path, models_ready: bool = True):
         client.app.dependency_overrides.clear()
         client.__exit__(None, None, None)
         server.get_service_config = original_get_config
+        server._RATE_LIMIT_STATE.clear()
+        server._RATE_LIMIT_LOCKS.clear()
 
     return client, audio_calls, _teardown
 
@@ -84,6 +87,8 @@ def test_health_and_capabilities(tmp_path):
         health_resp = client.get("/api/health")
         assert health_resp.status_code == 200
         assert health_resp.json()["status"] == "ok"
+        assert health_resp.json()["version"] == server.app.version
+        assert client.get("/api/health").json()["time"] == health_resp.json()["time"]
 
         cap_resp = client.get("/api/capabilities")
         assert cap_resp.status_code == 200
@@ -225,3 +230,20 @@ def test_job_status_updates_after_completion(tmp_path):
         assert calls == ["status run"]
     finally:
         cleanup()
+
+
+def test_rate_limit_rejects_burst_and_evicts_idle_clients(tmp_path):
+    client, _, cleanup = create_test_client(tmp_path, rate_limit_per_minute=2)
+    try:
+        for _ in range(2):
+            assert client.post("/api/bark/synthesize", json={"prompt": "burst"}).status_code == 200
+        limited = client.post("/api/bark/synthesize", json={"prompt": "burst"})
+        assert limited.status_code == 429
+
+        server._evict_idle_clients(server.time.monotonic())
+        assert server._RATE_LIMIT_STATE
+        server._evict_idle_clients(server.time.monotonic() + server._RATE_LIMIT_WINDOW_S)
+        assert server._RATE_LIMIT_STATE == {}
+        assert server._RATE_LIMIT_LOCKS == {}
+    finally:
+        cleanup()